@@ -1,14 +1,18 @@
 """Main Textual TUI application for sshman."""
 
 import subprocess
+import sys
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 
-from textual import on
+from textual import on, work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
 from textual.coordinate import Coordinate
 from textual.screen import ModalScreen, Screen
+from textual.timer import Timer
 from textual.widgets import (
     Button,
     Checkbox,
@@ -21,21 +25,18 @@ from textual.widgets import (
     TabbedContent,
     TabPane,
 )
+from textual.worker import get_current_worker
 
 from .docker import detect_shell, get_running_containers, is_docker_available
 from .keygen import generate_key
-from .models import Connection, DockerContainer, HistoryEntry
+from .models import AppConfig, Connection, DockerContainer, HistoryEntry
 from .ssh_agent import ensure_key_in_agent
 from .ssh_config import parse_ssh_config
 from .storage import (
-    add_connection,
+    ConfigWriter,
     add_history_entry,
-    delete_connection,
-    get_connections,
     get_history_entries,
     load_config,
-    save_config,
-    update_connection,
 )
 
 
@@ -485,7 +486,8 @@ class ImportScreen(ModalScreen[list[Connection]]):
 
     def __init__(self) -> None:
         super().__init__()
-        self.parsed_connections = parse_ssh_config()
+        # Filled in by _load_connections once ~/.ssh/config has been parsed
+        self.parsed_connections: tuple[Connection, ...] = ()
         self.selected_indices: set[int] = set()
 
     def compose(self) -> ComposeResult:
@@ -507,19 +509,31 @@ class ImportScreen(ModalScreen[list[Connection]]):
 
     def on_mount(self) -> None:
         table = self.query_one("#import-table", DataTable)
+        table.add_row("", "Loading ~/.ssh/config...", "", "", "")
+        self._load_connections()
+
+    @work(thread=True, exclusive=True)
+    def _load_connections(self) -> None:
+        """Parse ~/.ssh/config off the UI thread, then populate the table."""
+        connections = parse_ssh_config()
+        # The screen may have been dismissed while parsing
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._populate_table, connections)
+
+    def _populate_table(self, connections: tuple[Connection, ...]) -> None:
+        self.parsed_connections = connections
+        table = self.query_one("#import-table", DataTable)
+        table.clear()
 
         if not self.parsed_connections:
             table.add_row("", "No connections found in ~/.ssh/config", "", "", "")
             return
 
-        for i, conn in enumerate(self.parsed_connections):
-            table.add_row(
-                "[ ]",
-                conn.name,
-                conn.hostname,
-                conn.user or "-",
-                str(conn.port),
-                key=str(i),
+        # Insert all rows in one call and repaint once at the end
+        with self.app.batch_update():
+            table.add_rows(
+                ("[ ]", conn.name, conn.hostname, conn.user or "-", str(conn.port))
+                for conn in self.parsed_connections
             )
 
     @on(DataTable.RowSelected, "#import-table")
@@ -527,9 +541,9 @@ class ImportScreen(ModalScreen[list[Connection]]):
         if not self.parsed_connections:
             return
 
-        try:
-            idx = int(str(event.row_key.value))
-        except (ValueError, AttributeError):
+        # Rows are added in parsed_connections order, so the row is the index
+        idx = event.cursor_row
+        if not 0 <= idx < len(self.parsed_connections):
             return
 
         table = self.query_one("#import-table", DataTable)
@@ -572,6 +586,33 @@ class ImportScreen(ModalScreen[list[Connection]]):
         self.dismiss([])
 
 
+def _ssh_row_index(row_key: str) -> int | None:
+    """Decode the main-list index from an "ssh:<idx>" row key.
+
+    Returns None for Docker rows and malformed keys.
+    """
+    prefix, _, idx = row_key.partition(":")
+    if prefix != "ssh":
+        return None
+    try:
+        return int(idx)
+    except ValueError:
+        return None
+
+
+def _connection_row(conn: Connection) -> tuple[str, str, str, str, str]:
+    """Format the connections-table cells for an SSH connection."""
+    info_parts = []
+    if conn.description:
+        info_parts.append(conn.description)
+    if conn.identity_file:
+        info_parts.append(f"[{conn.identity_file}]")
+    info_str = " ".join(info_parts) if info_parts else "-"
+    tags_str = ", ".join(sorted(conn.tags)) if conn.tags else ""
+    type_str = "🔐 🔑" if conn.identity_file else "🔐"
+    return type_str, conn.name, tags_str, conn.display_target(), info_str
+
+
 class SSHManApp(App):
     """Main sshman application."""
 
@@ -638,10 +679,34 @@ class SSHManApp(App):
         Binding("2", "show_history", "History", show=True),
     ]
 
-    def __init__(self, error_message: str | None = None) -> None:
+    def __init__(
+        self,
+        error_message: str | None = None,
+        config_future: Future[AppConfig] | None = None,
+    ) -> None:
         super().__init__()
+        # Single in-memory copy of the stored config; mutations are applied
+        # here and persisted by config_writer, never re-read from disk.
+        self.config: AppConfig = AppConfig()
+        # Writes config changes off the UI thread; closed by run() on exit
+        self.config_writer = ConfigWriter(on_error=self._on_save_error)
+        # Background load_config started before the app, awaited in on_mount
+        self._config_future = config_future
         self.connections: list[Connection] = []
         self.filtered_connections: list[Connection] = []
+        # Lowercased "name\0hostname\0user" per connection, parallel to
+        # self.connections, so filtering is one substring test per row.
+        self._search_index: list[str] = []
+        # Rendered table cells per connection, parallel to self.connections
+        self._connection_rows: list[tuple[str, str, str, str, str]] = []
+        # Names of all saved connections, for duplicate checks on import
+        self._names: set[str] = set()
+        # Position in self.connections of each entry in filtered_connections
+        self._filtered_to_main: Sequence[int] = []
+        # Search term the connections table currently reflects
+        self._last_search: str = ""
+        # Pending filter run for the search box, restarted on every keystroke
+        self._search_timer: Timer | None = None
         self.docker_containers: list[DockerContainer] = []
         self.filtered_docker: list[DockerContainer] = []
         self.docker_available: bool = False
@@ -682,6 +747,14 @@ class SSHManApp(App):
         yield Footer()
 
     def on_mount(self) -> None:
+        self.query_one("#connections-table", DataTable).add_columns(
+            "", "Name", "Tags", "Target", "Info"
+        )
+        if self._config_future is not None:
+            # Wait for the background load; it leaves the parsed config in
+            # the load_config cache, so refresh_all does not re-read the file.
+            self._config_future.result()
+            self._config_future = None
         self.refresh_all()
         self.load_history()
         # Focus the search input on startup
@@ -697,16 +770,36 @@ class SSHManApp(App):
 
     def refresh_all(self) -> None:
         """Reload SSH connections and Docker containers."""
-        self.connections = get_connections()
+        # Let pending saves land first so the reload doesn't see stale data
+        self.config_writer.flush()
+        # Work on a copy: the loaded config is shared through the storage
+        # cache, which must only change once a save has succeeded
+        config = load_config()
+        self.config = AppConfig(
+            version=config.version, connections=[*config.connections]
+        )
         self.docker_available = is_docker_available()
         self.docker_containers = (
             get_running_containers() if self.docker_available else []
         )
-        self.filter_all()
+        self.refresh_connections()
 
     def refresh_connections(self) -> None:
-        """Reload connections from storage and update the table."""
-        self.refresh_all()
+        """Pick up changes made to the in-memory config and update the table."""
+        self.connections = self.config.connections
+        self._search_index = [
+            f"{c.name.lower()}\0{c.hostname.lower()}\0{(c.user or '').lower()}"
+            for c in self.connections
+        ]
+        self._connection_rows = [_connection_row(c) for c in self.connections]
+        self._names = {c.name for c in self.connections}
+        self.filter_all()
+
+    def _on_save_error(self, error: Exception) -> None:
+        """Report a failed background save (called on the writer thread)."""
+        # notify is thread-safe and only posts a message, so this never waits
+        # on the event loop (which may itself be waiting in flush())
+        self.notify(f"Failed to save connections: {error}", severity="error")
 
     # --- Tab navigation methods ---
 
@@ -798,31 +891,61 @@ class SSHManApp(App):
         """Filter both SSH connections and Docker containers based on search term."""
         search = search.lower().strip()
 
+        # Extending the previous search can only drop matches, so only the
+        # rows currently shown need testing and the table can be trimmed.
+        narrowing = bool(self._last_search) and search.startswith(self._last_search)
+        self._last_search = search
+        previous_indices = self._filtered_to_main
+        previous_docker = self.filtered_docker
+
         if search:
+            candidates = previous_indices if narrowing else range(len(self.connections))
+            self._filtered_to_main = [
+                i for i in candidates if search in self._search_index[i]
+            ]
             self.filtered_connections = [
-                c
-                for c in self.connections
-                if search in c.name.lower()
-                or search in c.hostname.lower()
-                or (c.user and search in c.user.lower())
+                self.connections[i] for i in self._filtered_to_main
             ]
             self.filtered_docker = [
                 d
-                for d in self.docker_containers
+                for d in (previous_docker if narrowing else self.docker_containers)
                 if search in d.name.lower() or search in d.image.lower()
             ]
         else:
-            self.filtered_connections = self.connections.copy()
-            self.filtered_docker = self.docker_containers.copy()
+            # Nothing is filtered out; the lists are only read, so share them
+            self._filtered_to_main = range(len(self.connections))
+            self.filtered_connections = self.connections
+            self.filtered_docker = self.docker_containers
 
-        self.update_table()
+        if narrowing and (self.filtered_connections or self.filtered_docker):
+            self._remove_unmatched_rows(previous_indices, previous_docker)
+        else:
+            self.update_table()
+
+    def _remove_unmatched_rows(
+        self,
+        previous_indices: Sequence[int],
+        previous_docker: list[DockerContainer],
+    ) -> None:
+        """Remove rows that dropped out of a narrowed search from the table."""
+        table = self.query_one("#connections-table", DataTable)
+        kept_indices = set(self._filtered_to_main)
+        kept_docker = {d.container_id for d in self.filtered_docker}
+
+        with self.batch_update():
+            for idx in previous_indices:
+                if idx not in kept_indices:
+                    table.remove_row(f"ssh:{idx}")
+            for container in previous_docker:
+                if container.container_id not in kept_docker:
+                    table.remove_row(f"docker:{container.container_id}")
 
     def update_table(self) -> None:
         """Update the DataTable with current filtered connections and containers."""
         table = self.query_one("#connections-table", DataTable)
         empty_msg = self.query_one("#empty-message", Static)
 
-        table.clear(columns=True)
+        table.clear()
 
         total_items = len(self.filtered_connections) + len(self.filtered_docker)
 
@@ -840,42 +963,31 @@ class SSHManApp(App):
         table.display = True
         empty_msg.display = False
 
-        table.add_columns("", "Name", "Tags", "Target", "Info")
-
-        # Add SSH connections
-        for conn in self.filtered_connections:
-            idx = self.connections.index(conn)
-            info_parts = []
-            if conn.description:
-                info_parts.append(conn.description)
-            if conn.identity_file:
-                info_parts.append(f"[{conn.identity_file}]")
-            info_str = " ".join(info_parts) if info_parts else "-"
-            tags_str = ", ".join(sorted(conn.tags)) if conn.tags else ""
-            type_str = "🔐 🔑" if conn.identity_file else "🔐"
-            table.add_row(
-                type_str,
-                conn.name,
-                tags_str,
-                conn.display_target(),
-                info_str,
-                key=f"ssh:{idx}",
-            )
-
-        # Add Docker containers
-        for container in self.filtered_docker:
-            table.add_row(
-                "🐳",
-                container.name,
-                "",
-                container.image,
-                container.container_id,
-                key=f"docker:{container.container_id}",
-            )
+        with self.batch_update():
+            # Add SSH connections
+            for idx in self._filtered_to_main:
+                table.add_row(*self._connection_rows[idx], key=f"ssh:{idx}")
+
+            # Add Docker containers
+            for container in self.filtered_docker:
+                table.add_row(
+                    "🐳",
+                    container.name,
+                    "",
+                    container.image,
+                    container.container_id,
+                    key=f"docker:{container.container_id}",
+                )
 
     @on(Input.Changed, "#search-input")
     def on_search_changed(self, event: Input.Changed) -> None:
-        self.filter_connections(event.value)
+        # Debounce so a burst of keystrokes triggers a single filter pass
+        if self._search_timer is not None:
+            self._search_timer.stop()
+        value = event.value
+        self._search_timer = self.set_timer(
+            0.08, lambda: self.filter_connections(value)
+        )
 
     @on(DataTable.RowSelected, "#connections-table")
     def on_row_selected(self, event: DataTable.RowSelected) -> None:  # noqa: ARG002
@@ -929,20 +1041,13 @@ class SSHManApp(App):
         row_key = self.get_selected_row_key()
         if row_key is None:
             return None
-
-        if row_key.startswith("ssh:"):
-            try:
-                return int(row_key.split(":")[1])
-            except (ValueError, IndexError):
-                return None
-
-        # If it's a Docker row, return None (not an SSH connection)
-        return None
+        return _ssh_row_index(row_key)
 
     def action_add_connection(self) -> None:
         def handle_result(connection: Connection | None) -> None:
             if connection:
-                add_connection(connection)
+                self.config.connections.append(connection)
+                self.config_writer.save(self.config)
                 self.refresh_connections()
                 self.notify(f"Added '{connection.name}'")
 
@@ -967,7 +1072,8 @@ class SSHManApp(App):
 
         def handle_result(updated: Connection | None) -> None:
             if updated:
-                update_connection(idx, updated)
+                self.config.connections[idx] = updated
+                self.config_writer.save(self.config)
                 self.refresh_connections()
                 self.notify(f"Updated '{updated.name}'")
 
@@ -992,7 +1098,8 @@ class SSHManApp(App):
 
         def handle_result(confirmed: bool | None) -> None:
             if confirmed:
-                delete_connection(idx)
+                self.config.connections.pop(idx)
+                self.config_writer.save(self.config)
                 self.refresh_connections()
                 self.notify(f"Deleted '{conn.name}'")
 
@@ -1001,18 +1108,16 @@ class SSHManApp(App):
     def action_import_config(self) -> None:
         def handle_result(imported: list[Connection] | None) -> None:
             if imported:
-                config = load_config()
-                existing_names = {c.name for c in config.connections}
-
                 added = 0
                 for conn in imported:
-                    if conn.name not in existing_names:
-                        config.connections.append(conn)
-                        existing_names.add(conn.name)
+                    if conn.name not in self._names:
+                        self._names.add(conn.name)
+                        self.config.connections.append(conn)
                         added += 1
 
-                save_config(config)
-                self.refresh_connections()
+                if added:
+                    self.config_writer.save(self.config)
+                    self.refresh_connections()
                 self.notify(f"Imported {added} connection(s)")
 
         self.push_screen(ImportScreen(), handle_result)
@@ -1023,9 +1128,9 @@ class SSHManApp(App):
             self.notify("No connection selected", severity="warning")
             return
 
-        if row_key.startswith("ssh:"):
+        idx = _ssh_row_index(row_key)
+        if idx is not None:
             try:
-                idx = int(row_key.split(":")[1])
                 conn = self.connections[idx]
                 ssh_cmd = conn.ssh_command()
                 # Return dict with command and metadata for history tracking
@@ -1039,7 +1144,7 @@ class SSHManApp(App):
                         "auto_add_key": conn.auto_add_key,
                     }
                 )
-            except (ValueError, IndexError):
+            except IndexError:
                 self.notify("Invalid selection", severity="error")
 
         elif row_key.startswith("docker:"):
@@ -1064,13 +1169,30 @@ class SSHManApp(App):
                 self.notify("Container not found", severity="error")
 
 
+def _load_config_in_background() -> Future[AppConfig]:
+    """Start load_config on a worker thread and return its future."""
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(load_config)
+    # Let the worker thread exit as soon as the load completes
+    executor.shutdown(wait=False)
+    return future
+
+
 def run() -> None:
     """Run the sshman application."""
     error_message: str | None = None
 
     while True:
-        app = SSHManApp(error_message=error_message)
+        # Parse connections.json while Textual sets up the terminal and
+        # composes the UI, instead of before first paint.
+        app = SSHManApp(
+            error_message=error_message,
+            config_future=_load_config_in_background(),
+        )
         result = app.run()
+        save_error = app.config_writer.close()
+        if save_error is not None:
+            print(f"[sshman] Failed to save connections: {save_error}", file=sys.stderr)
         error_message = None  # Clear for next iteration
 
         # If user quit without selecting a connection, exit
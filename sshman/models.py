@@ -1,32 +1,73 @@
 """Data models for SSH connections."""
 
 import sys
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from typing import Any
 
 from pydantic import BaseModel, Field
 
-
-class Connection(BaseModel):
-    """Represents an SSH connection configuration."""
-
-    name: str = Field(..., description="Display name / alias for the connection")
-    hostname: str = Field(..., description="Hostname or IP address")
-    user: str | None = Field(default=None, description="SSH username")
-    port: int = Field(default=22, ge=1, le=65535, description="SSH port")
-    identity_file: str | None = Field(
-        default=None, description="Path to private key file"
-    )
-    description: str | None = Field(
-        default=None, description="Optional description or notes"
-    )
-    auto_add_key: bool = Field(
-        default=False,
-        description="Automatically add identity_file to ssh-agent before connecting",
-    )
-    tags: list[str] = Field(
-        default_factory=list,
-        description="Tags for grouping related connections",
-    )
+# Leading ssh arguments shared by every connection
+_SSH_BASE_COMMAND = (
+    "ssh",
+    # Add connection timeout to fail fast on unreachable hosts
+    "-o",
+    "ConnectTimeout=10",
+    # Detect dead connections
+    "-o",
+    "ServerAliveInterval=5",
+    "-o",
+    "ServerAliveCountMax=2",
+)
+
+
+@dataclass(slots=True, frozen=True)
+class Connection:
+    """Represents an SSH connection configuration.
+
+    A slotted dataclass rather than a Pydantic model: connections are built in
+    bulk when loading storage and parsing ~/.ssh/config, and the only field
+    that needs validating is the port.
+    """
+
+    # Display name / alias for the connection
+    name: str
+    # Hostname or IP address
+    hostname: str
+    # SSH username
+    user: str | None = None
+    # SSH port
+    port: int = 22
+    # Path to private key file
+    identity_file: str | None = None
+    # Optional description or notes
+    description: str | None = None
+    # Automatically add identity_file to ssh-agent before connecting
+    auto_add_key: bool = False
+    # Tags for grouping related connections
+    tags: list[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if not 1 <= self.port <= 65535:
+            raise ValueError(f"Port must be between 1 and 65535, got {self.port}")
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Connection":
+        """Build a Connection from its stored dict, ignoring unknown keys.
+
+        Values are checked and coerced the way the earlier Pydantic model did,
+        so files it accepted (e.g. with a port stored as "2222") still load.
+
+        Raises:
+            TypeError, ValueError: If a field is missing or has an invalid value.
+        """
+        kwargs = {}
+        for key, value in data.items():
+            convert = _FIELD_CONVERTERS.get(key)
+            if convert is not None:
+                kwargs[key] = convert(key, value)
+        return cls(**kwargs)
 
     def ssh_add_command(self) -> list[str] | None:
         """Build the ssh-add command to load the identity key into the agent.
@@ -46,25 +87,15 @@ class Connection(BaseModel):
 
     def ssh_command(self) -> list[str]:
         """Build the SSH command arguments for this connection."""
-        cmd = ["ssh"]
-
-        # Add connection timeout to fail fast on unreachable hosts
-        cmd.extend(["-o", "ConnectTimeout=10"])
-        # Detect dead connections
-        cmd.extend(["-o", "ServerAliveInterval=5"])
-        cmd.extend(["-o", "ServerAliveCountMax=2"])
+        cmd = list(_SSH_BASE_COMMAND)
 
         if self.port != 22:
-            cmd.extend(["-p", str(self.port)])
+            cmd += ("-p", str(self.port))
 
         if self.identity_file:
-            cmd.extend(["-i", self.identity_file])
-
-        if self.user:
-            cmd.append(f"{self.user}@{self.hostname}")
-        else:
-            cmd.append(self.hostname)
+            cmd += ("-i", self.identity_file)
 
+        cmd.append(f"{self.user}@{self.hostname}" if self.user else self.hostname)
         return cmd
 
     def display_target(self) -> str:
@@ -78,6 +109,63 @@ class Connection(BaseModel):
         return target
 
 
+def _to_str(key: str, value: Any) -> str:
+    if not isinstance(value, str):
+        raise TypeError(f"{key} must be a string, got {type(value).__name__}")
+    return value
+
+
+def _to_optional_str(key: str, value: Any) -> str | None:
+    return None if value is None else _to_str(key, value)
+
+
+def _to_int(key: str, value: Any) -> int:
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        return int(value.strip())
+    raise TypeError(f"{key} must be an integer, got {type(value).__name__}")
+
+
+_TRUE_STRINGS = frozenset(("1", "on", "t", "true", "y", "yes"))
+_FALSE_STRINGS = frozenset(("0", "off", "f", "false", "n", "no"))
+
+
+def _to_bool(key: str, value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int | float) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+    raise ValueError(f"{key} must be a boolean, got {value!r}")
+
+
+def _to_str_list(key: str, value: Any) -> list[str]:
+    if not isinstance(value, list):
+        raise TypeError(f"{key} must be a list, got {type(value).__name__}")
+    return [_to_str(key, item) for item in value]
+
+
+# Converter for each stored Connection field, applied by Connection.from_dict
+_FIELD_CONVERTERS: dict[str, Callable[[str, Any], Any]] = {
+    "name": _to_str,
+    "hostname": _to_str,
+    "user": _to_optional_str,
+    "port": _to_int,
+    "identity_file": _to_optional_str,
+    "description": _to_optional_str,
+    "auto_add_key": _to_bool,
+    "tags": _to_str_list,
+}
+
+
 class DockerContainer(BaseModel):
     """Represents a running Docker container."""
 
@@ -102,13 +190,30 @@ class DockerContainer(BaseModel):
         return self.image
 
 
-class AppConfig(BaseModel):
+@dataclass(slots=True)
+class AppConfig:
     """Application configuration stored in connections.json."""
 
-    version: str = Field(default="1.0", description="Config file version")
-    connections: list[Connection] = Field(
-        default_factory=list, description="List of saved connections"
-    )
+    # Config file version
+    version: str = "1.0"
+    # List of saved connections
+    connections: list[Connection] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "AppConfig":
+        """Build an AppConfig from the parsed connections.json contents.
+
+        Raises:
+            TypeError, ValueError: If the data does not describe a valid config.
+        """
+        return cls(
+            version=_to_str("version", data.get("version", "1.0")),
+            connections=[Connection.from_dict(c) for c in data.get("connections", [])],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the config as JSON-serialisable plain data."""
+        return asdict(self)
 
 
 class HistoryEntry(BaseModel):
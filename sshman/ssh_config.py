@@ -1,99 +1,183 @@
 """SSH config file parser for importing existing connections."""
 
 import contextlib
-import re
+import functools
+import os
+import sys
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
+from typing import Any
 
 from .models import Connection
 
+# Shared result for missing, unreadable or empty configs
+_EMPTY: tuple[Connection, ...] = ()
+
+# Resolved once; "~/" prefixes are expanded by plain concatenation
+_HOME = os.path.expanduser("~")
+
+
+def _set_field(field: str) -> Callable[[dict[str, Any], str], None]:
+    """Build a handler storing a directive's value as a Connection field."""
+
+    def set_field(fields: dict[str, Any], value: str) -> None:
+        fields[field] = value
+
+    return set_field
+
+
+def _set_user(fields: dict[str, Any], value: str) -> None:
+    # Few distinct users across many hosts; share one string per name
+    fields["user"] = sys.intern(value)
+
+
+def _set_port(fields: dict[str, Any], value: str) -> None:
+    # Unparsable or out-of-range ports fall back to the Connection default
+    with contextlib.suppress(ValueError):
+        port = int(value)
+        if 1 <= port <= 65535:
+            fields["port"] = port
+
+
+def _set_identity_file(fields: dict[str, Any], value: str) -> None:
+    # Expand ~ in identity file path
+    if value[:2] in ("~/", "~" + os.sep):
+        value = _HOME + value[1:]
+    elif value.startswith("~"):
+        # ~user/... needs a password-database lookup
+        value = os.path.expanduser(value)
+    fields["identity_file"] = value
+
+
+# Host-block directives we import, keyed by lowercased keyword bytes; each
+# handler stores the converted value into the pending Connection's arguments.
+_DISPATCH: dict[bytes, Callable[[dict[str, Any], str], None]] = {
+    b"hostname": _set_field("hostname"),
+    b"user": _set_user,
+    b"port": _set_port,
+    b"identityfile": _set_identity_file,
+}
+
 
 def get_ssh_config_path() -> Path:
     """Get the path to the user's SSH config file."""
     return Path.home() / ".ssh" / "config"
 
 
-def parse_ssh_config() -> list[Connection]:
+def parse_ssh_config() -> tuple[Connection, ...]:
     """
-    Parse ~/.ssh/config and return a list of Connection objects.
+    Parse ~/.ssh/config and return a tuple of Connection objects.
 
     This is a simple parser that handles the most common directives.
+    Results are cached per file path, modification time and size, so an
+    unchanged config is only parsed once; the immutable result is shared
+    between callers.
     """
     config_path = get_ssh_config_path()
 
-    if not config_path.exists():
-        return []
-
-    connections: list[Connection] = []
-    current_host: dict[str, str] = {}
-
     try:
-        content = config_path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
-        return []
+        stat = config_path.stat()
+    except OSError:
+        return _EMPTY
 
-    for line in content.splitlines():
-        # Remove comments and strip whitespace
-        line = re.sub(r"#.*$", "", line).strip()
+    # An empty file can't define hosts; no need to open it
+    if stat.st_size == 0:
+        return _EMPTY
 
-        if not line:
-            continue
+    return _parse_cached(str(config_path), stat.st_mtime_ns, stat.st_size)
 
-        # Parse key-value pairs (handles both "Key Value" and "Key=Value")
-        match = re.match(r"^(\w+)\s*[=\s]\s*(.+)$", line, re.IGNORECASE)
-        if not match:
-            continue
 
-        key = match.group(1).lower()
-        value = match.group(2).strip()
+@functools.lru_cache(maxsize=8)
+def _parse_cached(
+    path: str,
+    mtime_ns: int,  # noqa: ARG001 - cache key only
+    size: int,  # noqa: ARG001 - cache key only
+) -> tuple[Connection, ...]:
+    return _parse(Path(path))
 
-        if key == "host":
-            # Save previous host if exists
-            if current_host and "host" in current_host:
-                conn = _dict_to_connection(current_host)
-                if conn:
-                    connections.append(conn)
-
-            # Start new host block
-            current_host = {"host": value}
-        else:
-            # Add directive to current host
-            current_host[key] = value
 
-    # Don't forget the last host
-    if current_host and "host" in current_host:
-        conn = _dict_to_connection(current_host)
-        if conn:
-            connections.append(conn)
+def _parse(config_path: Path) -> tuple[Connection, ...]:
+    """Parse the SSH config at config_path into Connection objects.
 
-    return connections
-
-
-def _dict_to_connection(data: dict[str, str]) -> Connection | None:
-    """Convert a parsed host dict to a Connection object."""
-    host = data.get("host", "")
-
-    # Skip wildcard patterns and empty hosts
-    if not host or "*" in host or "?" in host:
-        return None
+    The config grammar is ASCII, so the file is tokenized as bytes and only
+    the values we keep are decoded.
+    """
+    try:
+        data = config_path.read_bytes()
+    except OSError:
+        return _EMPTY
+
+    # Size the host list for Host lines written the usual way, "Host alias"
+    # at the start of a line; any further blocks are appended past the estimate.
+    estimate = data.count(b"\nHost ") + data.startswith(b"Host ")
+    hosts: list[dict[str, Any] | None] = [None] * estimate
+    count = 0
+    # Connection keyword arguments for the current Host block, or None while
+    # inside a block we don't import (or before the first Host)
+    current_host: dict[str, Any] | None = None
+
+    # First pass: collect each Host block's fields
+    for key, value in _iter_directives(data.splitlines()):
+        if key == b"host":
+            # Wildcard patterns aren't concrete hosts; ignore the whole block
+            if b"*" in value or b"?" in value:
+                current_host = None
+                continue
+
+            current_host = {"name": _decode(value)}
+            if count < estimate:
+                hosts[count] = current_host
+            else:
+                hosts.append(current_host)
+            count += 1
+        elif current_host is not None:
+            handler = _DISPATCH.get(key)
+            if handler is not None:
+                handler(current_host, _decode(value))
+
+    # Drop unused slots when the estimate counted skipped wildcard blocks
+    del hosts[count:]
+    # The small per-host dicts are all we need now; release the file contents
+    # before allocating the Connection objects
+    del data
+
+    # Second pass: build the connections
+    return tuple(map(_to_connection, hosts)) if hosts else _EMPTY
+
+
+def _to_connection(fields: dict[str, Any]) -> Connection:
+    """Build a Connection from a Host block's collected fields."""
+    # Fall back to the host alias if HostName is not specified
+    return Connection(**{"hostname": fields["name"], **fields})
+
+
+def _decode(value: bytes) -> str:
+    # Values such as IdentityFile paths may be non-ASCII; keep them readable
+    return value.decode("utf-8", "replace")
+
+
+def _iter_directives(lines: Iterable[bytes]) -> Iterator[tuple[bytes, bytes]]:
+    """Yield (lowercased keyword, value) pairs from SSH config lines.
+
+    Handles "Key Value", "Key=Value" and "Key = Value" forms and skips
+    comments, blank lines and directives without a value.
+    """
+    for line in lines:
+        # Remove comments and strip whitespace
+        line = line.partition(b"#")[0].strip()
 
-    # Get hostname (fallback to host alias if not specified)
-    hostname = data.get("hostname", host)
+        if not line:
+            continue
 
-    # Parse port
-    port = 22
-    if "port" in data:
-        with contextlib.suppress(ValueError):
-            port = int(data["port"])
+        parts = line.split(None, 1)
+        key = parts[0]
+        if b"=" in key:
+            key, _, value = line.partition(b"=")
+        elif len(parts) == 2:
+            value = parts[1]
+        else:
+            continue
 
-    # Expand ~ in identity file path
-    identity_file = data.get("identityfile")
-    if identity_file and identity_file.startswith("~"):
-        identity_file = str(Path(identity_file).expanduser())
-
-    return Connection(
-        name=host,
-        hostname=hostname,
-        user=data.get("user"),
-        port=port,
-        identity_file=identity_file,
-    )
+        value = value.lstrip(b"= \t").strip()
+        if value:
+            yield key.lower(), value
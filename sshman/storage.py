@@ -1,15 +1,91 @@
 """Storage layer for loading and saving connections."""
 
 import json
+import os
+import queue
+import tempfile
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager, suppress
+from dataclasses import asdict, is_dataclass
 from pathlib import Path
+from stat import S_IMODE
+from typing import Any
 
 from .models import AppConfig, Connection, HistoryConfig, HistoryEntry
 
 
+def _encode_default(obj: Any) -> Any:
+    # The stdlib encoder doesn't know dataclasses; orjson and msgspec do
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(
+        obj, separators=(",", ":"), ensure_ascii=False, default=_encode_default
+    ).encode("utf-8")
+
+
+_JsonBackend = tuple[
+    Callable[[bytes], Any], Callable[[Any], bytes], tuple[type[Exception], ...]
+]
+
+# (loads, dumps, errors loads raises besides ValueError) for each available
+# JSON library; the first is used. orjson and msgspec are optional speedups.
+# Every dumps encodes dataclasses and produces the same compact UTF-8 JSON,
+# and every loads returns plain builtins, so the files read and written (and
+# the coercion applied by AppConfig.from_dict) are identical for all of them.
+_JSON_BACKENDS: dict[str, _JsonBackend] = {}
+try:
+    import orjson
+except ImportError:
+    pass
+else:
+    _JSON_BACKENDS["orjson"] = (orjson.loads, orjson.dumps, ())
+try:
+    import msgspec
+except ImportError:
+    pass
+else:
+    _JSON_BACKENDS["msgspec"] = (
+        msgspec.json.decode,
+        msgspec.json.Encoder().encode,
+        (msgspec.DecodeError,),
+    )
+_JSON_BACKENDS["json"] = (json.loads, _stdlib_dumps, ())
+
+_loads, _dumps, _JSON_ERRORS = next(iter(_JSON_BACKENDS.values()))
+
+# Config directory already ensured to exist by get_config_dir
+_config_dir: Path | None = None
+
+# Parsed contents of each JSON file with the (mtime_ns, size) it was read at,
+# so repeated loads of an unchanged file skip the read and validation.
+_cache: dict[Path, tuple[int, int, Any]] = {}
+
+# Position of the first connection with each name, for the cached connections
+# list it was built from. The storage mutators keep it in sync; a different
+# list (after a reload or a save of another AppConfig) gets a fresh index.
+_name_index: tuple[list[Connection], dict[str, int]] = ([], {})
+
+# Tuple returned by get_connections, with the cached connections list it was
+# built from; save_config drops it, as every change to that list is saved.
+_connections_tuple: tuple[list[Connection] | None, tuple[Connection, ...]] = (
+    None,
+    (),
+)
+
+
 def get_config_dir() -> Path:
     """Get the sshman config directory, creating it if needed."""
+    global _config_dir
     config_dir = Path.home() / ".config" / "sshman"
-    config_dir.mkdir(parents=True, exist_ok=True)
+    # Only the first call (per home directory) needs the mkdir syscall
+    if config_dir != _config_dir:
+        config_dir.mkdir(parents=True, exist_ok=True)
+        _config_dir = config_dir
     return config_dir
 
 
@@ -18,56 +94,318 @@ def get_config_path() -> Path:
     return get_config_dir() / "connections.json"
 
 
+def _cached(path: Path, stat: os.stat_result) -> Any | None:
+    """Return the cached parse of path if the file is unchanged, else None."""
+    entry = _cache.get(path)
+    if entry is None or entry[:2] != (stat.st_mtime_ns, stat.st_size):
+        return None
+    return entry[2]
+
+
+def _remember(path: Path, value: Any, stat: os.stat_result) -> None:
+    """Record value as the parsed state of path at the given stat."""
+    _cache[path] = (stat.st_mtime_ns, stat.st_size, value)
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Replace the contents of path with data without exposing a partial file.
+
+    The data is written and fsynced to a uniquely named temporary file next to
+    path, which is then renamed over it in a single os.replace; concurrent
+    writers each use their own temporary file, and it is removed if anything
+    fails. Symlinks are followed, so the file they point to is the one
+    replaced, and its permissions are kept (new files are private to the
+    user).
+    """
+    path = path.resolve()
+    try:
+        mode = S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            if mode is not None:
+                os.chmod(tmp_name, mode)
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
 def load_config() -> AppConfig:
-    """Load the app config from disk, or return default if not exists."""
+    """Load the app config from disk, or return default if not exists.
+
+    The parsed config is cached and reused for as long as the file's mtime and
+    size are unchanged, so callers get the same object back until the file is
+    modified (by ``save_config`` or externally).
+    """
     config_path = get_config_path()
 
-    if not config_path.exists():
+    try:
+        stat = config_path.stat()
+    except OSError:
         return AppConfig()
 
+    cached = _cached(config_path, stat)
+    if cached is not None:
+        return cached
+
     try:
-        data = json.loads(config_path.read_text(encoding="utf-8"))
-        return AppConfig.model_validate(data)
-    except (json.JSONDecodeError, ValueError):
+        config = AppConfig.from_dict(_loads(config_path.read_bytes()))
+    except (AttributeError, TypeError, ValueError, *_JSON_ERRORS):
         # If config is corrupted, return default
         return AppConfig()
 
+    _remember(config_path, config, stat)
+    return config
+
 
 def save_config(config: AppConfig) -> None:
-    """Save the app config to disk."""
+    """Save the app config to disk.
+
+    The file is replaced atomically, so an interrupted write never leaves a
+    truncated config. Nothing is written if the file already holds exactly
+    the same contents.
+    """
+    global _connections_tuple
     config_path = get_config_path()
-    config_path.write_text(
-        config.model_dump_json(indent=2),
-        encoding="utf-8",
-    )
+    try:
+        data = _dumps(config)
+        try:
+            unchanged = config_path.read_bytes() == data
+        except OSError:
+            unchanged = False
+        if not unchanged:
+            _atomic_write(config_path, data)
+        _remember(config_path, config, config_path.stat())
+        _connections_tuple = (None, ())
+    except BaseException:
+        # config may be the cached object with the unsaved changes applied;
+        # drop it so the next load re-reads what is actually on disk
+        _cache.pop(config_path, None)
+        raise
+
+
+class ConfigWriter:
+    """Save AppConfig snapshots on a background thread.
+
+    Saves requested while a write is still pending are coalesced, so a burst
+    of edits results in a single write of the latest state. Failed saves are
+    passed to on_error while the writer is open, after the save is marked
+    done, so on_error never holds up flush(). close() returns the failure if
+    the last save did not succeed.
+    """
+
+    def __init__(self, on_error: Callable[[Exception], None] | None = None) -> None:
+        self._on_error = on_error
+        # Holds at most the one snapshot still waiting to be written
+        self._pending: queue.Queue[AppConfig | None] = queue.Queue(maxsize=1)
+        self._thread: threading.Thread | None = None
+        # Set by close(); on_error is no longer called after that
+        self._closing = False
+        # Failure of the most recent save, cleared when a later one succeeds
+        self._error: Exception | None = None
+
+    def save(self, config: AppConfig) -> None:
+        """Schedule config to be written, replacing any unwritten snapshot."""
+        # Connections are immutable, so a shallow copy is a stable snapshot
+        snapshot = AppConfig(version=config.version, connections=[*config.connections])
+        try:
+            self._pending.get_nowait()
+            self._pending.task_done()
+        except queue.Empty:
+            pass
+        self._pending.put_nowait(snapshot)
+        self._ensure_thread()
+
+    def flush(self) -> None:
+        """Block until every scheduled save has been written."""
+        self._ensure_thread()
+        self._pending.join()
+
+    def close(self) -> Exception | None:
+        """Write any pending save and stop the background thread.
+
+        Returns:
+            The error from the last save if it failed (so the latest changes
+            are not on disk), or None.
+        """
+        self._closing = True
+        if self._thread is None:
+            return self._error
+        self.flush()
+        self._pending.put(None)
+        self._thread.join()
+        self._thread = None
+        return self._error
+
+    def _ensure_thread(self) -> None:
+        # (Re)start the worker if it was never started or has died
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="sshman-config-writer", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            config = self._pending.get()
+            if config is None:
+                self._pending.task_done()
+                return
+
+            error: Exception | None = None
+            try:
+                save_config(config)
+            except Exception as e:
+                error = e
+            self._error = error
+            self._pending.task_done()
+
+            # Reported only after task_done, so a handler waiting on the UI
+            # thread can't deadlock with that thread blocked in flush()
+            if error is not None and self._on_error is not None and not self._closing:
+                # If the handler can't report it (e.g. the app has exited),
+                # close() still returns it
+                with suppress(Exception):
+                    self._on_error(error)
+
+
+@contextmanager
+def transaction() -> Iterator[AppConfig]:
+    """Load the config for a batch of changes and save it once at the end.
+
+    Nothing is written if the block raises.
+    """
+    config = load_config()
+    try:
+        yield config
+    except BaseException:
+        # The cached object may hold half-applied changes; drop it
+        _cache.pop(get_config_path(), None)
+        raise
+    save_config(config)
+
+
+def _indexed_names(connections: list[Connection]) -> dict[str, int] | None:
+    """Return the name index if it was built for connections, else None."""
+    indexed, index = _name_index
+    return index if indexed is connections else None
+
+
+def _index_added(connections: list[Connection], start: int) -> None:
+    """Add connections[start:] to the name index, if it covers connections."""
+    index = _indexed_names(connections)
+    if index is not None:
+        for i in range(start, len(connections)):
+            index.setdefault(connections[i].name, i)
+
+
+def _first_position(connections: list[Connection], name: str, start: int) -> int:
+    """Return the index of the first connection named name at or after start."""
+    for i in range(start, len(connections)):
+        if connections[i].name == name:
+            return i
+    return -1
 
 
 def add_connection(connection: Connection) -> None:
     """Add a new connection to storage."""
-    config = load_config()
-    config.connections.append(connection)
-    save_config(config)
+    with transaction() as config:
+        config.connections.append(connection)
+        _index_added(config.connections, len(config.connections) - 1)
+
+
+def add_connections(connections: Iterable[Connection]) -> None:
+    """Add several connections to storage with a single write."""
+    with transaction() as config:
+        start = len(config.connections)
+        config.connections.extend(connections)
+        _index_added(config.connections, start)
 
 
 def update_connection(index: int, connection: Connection) -> None:
     """Update an existing connection by index."""
     config = load_config()
-    if 0 <= index < len(config.connections):
-        config.connections[index] = connection
+    connections = config.connections
+    if 0 <= index < len(connections):
+        old_name = connections[index].name
+        connections[index] = connection
+
+        names = _indexed_names(connections)
+        if names is not None and old_name != connection.name:
+            if names.get(old_name) == index:
+                # The next duplicate, if any, becomes the first of that name
+                position = _first_position(connections, old_name, index + 1)
+                if position < 0:
+                    del names[old_name]
+                else:
+                    names[old_name] = position
+            if names.get(connection.name, index + 1) > index:
+                names[connection.name] = index
+
         save_config(config)
 
 
 def delete_connection(index: int) -> None:
     """Delete a connection by index."""
     config = load_config()
-    if 0 <= index < len(config.connections):
-        config.connections.pop(index)
+    connections = config.connections
+    if 0 <= index < len(connections):
+        name = connections.pop(index).name
+
+        names = _indexed_names(connections)
+        if names is not None:
+            # Everything after the removed entry moves up by one
+            for other, position in names.items():
+                if position > index:
+                    names[other] = position - 1
+            if names[name] == index:
+                position = _first_position(connections, name, index)
+                if position < 0:
+                    del names[name]
+                else:
+                    names[name] = position
+
         save_config(config)
 
 
-def get_connections() -> list[Connection]:
-    """Get all saved connections."""
-    return load_config().connections
+def get_connections() -> tuple[Connection, ...]:
+    """Get all saved connections.
+
+    Returned as a tuple so callers cannot modify the cached config. The tuple
+    is built once per change and shared between calls.
+    """
+    global _connections_tuple
+    connections = load_config().connections
+
+    source, result = _connections_tuple
+    if source is not connections:
+        result = tuple(connections)
+        _connections_tuple = (connections, result)
+    return result
+
+
+def get_connection_by_name(name: str) -> Connection | None:
+    """Get the first saved connection with the given name, or None."""
+    global _name_index
+    connections = load_config().connections
+
+    index = _indexed_names(connections)
+    if index is None:
+        index = {}
+        for i, conn in enumerate(connections):
+            index.setdefault(conn.name, i)
+        _name_index = (connections, index)
+
+    i = index.get(name)
+    return None if i is None else connections[i]
 
 
 # --- History storage functions ---
@@ -79,27 +417,42 @@ def get_history_path() -> Path:
 
 
 def load_history() -> HistoryConfig:
-    """Load the history config from disk, or return default if not exists."""
+    """Load the history config from disk, or return default if not exists.
+
+    Cached like load_config, keyed on the file's mtime and size.
+    """
     history_path = get_history_path()
 
-    if not history_path.exists():
+    try:
+        stat = history_path.stat()
+    except OSError:
         return HistoryConfig()
 
+    cached = _cached(history_path, stat)
+    if cached is not None:
+        return cached
+
     try:
-        data = json.loads(history_path.read_text(encoding="utf-8"))
-        return HistoryConfig.model_validate(data)
-    except (json.JSONDecodeError, ValueError):
+        data = _loads(history_path.read_bytes())
+        history = HistoryConfig.model_validate(data)
+    except (ValueError, *_JSON_ERRORS):
         # If history is corrupted, return default
         return HistoryConfig()
 
+    _remember(history_path, history, stat)
+    return history
+
 
 def save_history(config: HistoryConfig) -> None:
     """Save the history config to disk."""
     history_path = get_history_path()
-    history_path.write_text(
-        config.model_dump_json(indent=2),
-        encoding="utf-8",
-    )
+    try:
+        _atomic_write(history_path, config.model_dump_json(indent=2).encode("utf-8"))
+        _remember(history_path, config, history_path.stat())
+    except BaseException:
+        # Same as save_config: don't keep unsaved changes in the cache
+        _cache.pop(history_path, None)
+        raise
 
 
 def add_history_entry(entry: HistoryEntry) -> None:
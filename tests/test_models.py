@@ -1,5 +1,7 @@
 """Tests for the Connection model."""
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from sshman.models import Connection
@@ -175,3 +177,24 @@ class TestConnection:
         """Test that port must be at most 65535."""
         with pytest.raises(ValueError):
             Connection(name="test", hostname="example.com", port=65536)
+
+    def test_connection_is_immutable(self) -> None:
+        """Test that connections are frozen and carry no instance __dict__."""
+        conn = Connection(name="test", hostname="example.com")
+
+        with pytest.raises(FrozenInstanceError):
+            conn.port = 2222  # type: ignore[misc]
+        assert not hasattr(conn, "__dict__")
+
+    def test_from_dict_coerces_like_pydantic(self) -> None:
+        """Test that from_dict coerces lax values and rejects wrong types."""
+        conn = Connection.from_dict(
+            {"name": "a", "hostname": "h", "port": "2222", "auto_add_key": "true"}
+        )
+        assert conn.port == 2222
+        assert conn.auto_add_key is True
+
+        with pytest.raises(TypeError):
+            Connection.from_dict({"name": "a", "hostname": "h", "user": 42})
+        with pytest.raises(TypeError):
+            Connection.from_dict({"name": "a", "hostname": "h", "tags": "web"})
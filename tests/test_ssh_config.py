@@ -31,7 +31,7 @@ class TestSSHConfigParser:
 
         connections = parse_ssh_config()
 
-        assert connections == []
+        assert connections == ()
 
     def test_parse_nonexistent_config(self, temp_ssh_config: Path) -> None:
         """Test parsing when config file doesn't exist."""
@@ -40,7 +40,7 @@ class TestSSHConfigParser:
 
         connections = parse_ssh_config()
 
-        assert connections == []
+        assert connections == ()
 
     def test_parse_simple_host(self, temp_ssh_config: Path) -> None:
         """Test parsing a simple host entry."""
@@ -77,6 +77,23 @@ Host myserver
         assert len(connections) == 1
         assert connections[0].port == 2222
 
+    def test_parse_host_with_invalid_port(self, temp_ssh_config: Path) -> None:
+        """Test that an unusable port falls back to the default."""
+        temp_ssh_config.write_text(
+            """
+Host myserver
+    Port 99999
+
+Host other
+    Port ssh
+""",
+            encoding="utf-8",
+        )
+
+        connections = parse_ssh_config()
+
+        assert [c.port for c in connections] == [22, 22]
+
     def test_parse_host_with_identity_file(self, temp_ssh_config: Path) -> None:
         """Test parsing host with identity file."""
         temp_ssh_config.write_text(
@@ -137,6 +154,25 @@ Host myserver
         assert len(connections) == 1
         assert connections[0].name == "myserver"
 
+    def test_skip_single_char_wildcard_hosts(self, temp_ssh_config: Path) -> None:
+        """Test that hosts using the ? wildcard are skipped with their block."""
+        temp_ssh_config.write_text(
+            """
+Host web?
+    User deploy
+
+Host myserver
+    HostName example.com
+""",
+            encoding="utf-8",
+        )
+
+        connections = parse_ssh_config()
+
+        assert len(connections) == 1
+        assert connections[0].name == "myserver"
+        assert connections[0].user is None
+
     def test_parse_with_comments(self, temp_ssh_config: Path) -> None:
         """Test parsing config with comments."""
         temp_ssh_config.write_text(
@@ -154,6 +190,26 @@ Host myserver
         assert len(connections) == 1
         assert connections[0].hostname == "example.com"
 
+    def test_comment_only_values_are_ignored(self, temp_ssh_config: Path) -> None:
+        """Test that indented comments and comment-only values are skipped."""
+        temp_ssh_config.write_text(
+            """
+Host myserver  # production
+    # HostName commented.example.com
+    User # nobody
+    Port 2222#ssh
+""",
+            encoding="utf-8",
+        )
+
+        connections = parse_ssh_config()
+
+        assert len(connections) == 1
+        assert connections[0].name == "myserver"
+        assert connections[0].hostname == "myserver"
+        assert connections[0].user is None
+        assert connections[0].port == 2222
+
     def test_host_without_hostname_uses_alias(self, temp_ssh_config: Path) -> None:
         """Test that host alias is used when HostName is not specified."""
         temp_ssh_config.write_text(
@@ -169,3 +225,66 @@ Host example.com
         assert len(connections) == 1
         assert connections[0].name == "example.com"
         assert connections[0].hostname == "example.com"
+
+    def test_parse_equals_separated_directives(self, temp_ssh_config: Path) -> None:
+        """Test parsing directives written as Key=Value or Key = Value."""
+        temp_ssh_config.write_text(
+            """
+Host=myserver
+    HostName = example.com
+    User=admin
+    Port =2222
+""",
+            encoding="utf-8",
+        )
+
+        connections = parse_ssh_config()
+
+        assert len(connections) == 1
+        assert connections[0].name == "myserver"
+        assert connections[0].hostname == "example.com"
+        assert connections[0].user == "admin"
+        assert connections[0].port == 2222
+
+    def test_reparse_after_config_change(self, temp_ssh_config: Path) -> None:
+        """Test that editing the config file is picked up despite caching."""
+        temp_ssh_config.write_text("Host first\n", encoding="utf-8")
+        assert [c.name for c in parse_ssh_config()] == ["first"]
+
+        temp_ssh_config.write_text("Host second\nHost third\n", encoding="utf-8")
+        assert [c.name for c in parse_ssh_config()] == ["second", "third"]
+
+    def test_parse_non_ascii_values(self, temp_ssh_config: Path) -> None:
+        """Test that non-ASCII values survive the bytes-level parsing."""
+        temp_ssh_config.write_text(
+            """
+Host münchen
+    User jörg
+    IdentityFile /keys/jörg_ed25519
+""",
+            encoding="utf-8",
+        )
+
+        connections = parse_ssh_config()
+
+        assert len(connections) == 1
+        assert connections[0].name == "münchen"
+        assert connections[0].user == "jörg"
+        assert connections[0].identity_file == "/keys/jörg_ed25519"
+
+    def test_user_strings_are_shared(self, temp_ssh_config: Path) -> None:
+        """Test that hosts with the same User share one interned string."""
+        temp_ssh_config.write_text(
+            """
+Host one
+    User deploy
+Host two
+    User deploy
+""",
+            encoding="utf-8",
+        )
+
+        first, second = parse_ssh_config()
+
+        assert first.user == "deploy"
+        assert first.user is second.user
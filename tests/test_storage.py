@@ -1,20 +1,43 @@
 """Tests for the storage module."""
 
+import sys
+import threading
+from datetime import datetime
 from pathlib import Path
+from stat import S_IMODE
 
 import pytest
 
-from sshman.models import AppConfig, Connection
+from sshman.models import AppConfig, Connection, HistoryEntry
 from sshman.storage import (
+    _JSON_BACKENDS,
+    ConfigWriter,
     add_connection,
+    add_connections,
+    add_history_entry,
     delete_connection,
+    get_connection_by_name,
     get_connections,
     load_config,
+    load_history,
     save_config,
+    transaction,
     update_connection,
 )
 
 
+@pytest.fixture(autouse=True, params=list(_JSON_BACKENDS))
+def json_backend(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> str:
+    """Run every storage test against each available JSON library."""
+    loads, dumps, errors = _JSON_BACKENDS[request.param]
+    monkeypatch.setattr("sshman.storage._loads", loads)
+    monkeypatch.setattr("sshman.storage._dumps", dumps)
+    monkeypatch.setattr("sshman.storage._JSON_ERRORS", errors)
+    return request.param
+
+
 @pytest.fixture
 def temp_config_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     """Create a temporary config directory for testing."""
@@ -75,6 +98,42 @@ class TestStorage:
         assert connections[0].name == "server1"
         assert connections[1].name == "server2"
 
+    def test_add_connections_bulk(self, temp_config_dir: Path) -> None:
+        """Test adding several connections in one call."""
+        add_connections(
+            Connection(name=f"server{i}", hostname=f"example{i}.com") for i in range(3)
+        )
+        connections = get_connections()
+
+        assert [c.name for c in connections] == ["server0", "server1", "server2"]
+
+    def test_transaction_discarded_on_error(self, temp_config_dir: Path) -> None:
+        """Test that a failing transaction leaves the stored config untouched."""
+        add_connection(Connection(name="keep", hostname="example.com"))
+
+        with pytest.raises(RuntimeError), transaction() as config:
+            config.connections.clear()
+            raise RuntimeError("boom")
+
+        assert [c.name for c in get_connections()] == ["keep"]
+
+    def test_failed_save_discards_cached_changes(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a failing write doesn't leave unsaved changes cached."""
+        add_connection(Connection(name="a", hostname="a.com"))
+
+        def fail(path: Path, data: bytes) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr("sshman.storage._atomic_write", fail)
+        with pytest.raises(OSError):
+            add_connection(Connection(name="ghost", hostname="ghost.com"))
+        with pytest.raises(OSError):
+            delete_connection(0)
+
+        assert [c.name for c in load_config().connections] == ["a"]
+
     def test_update_connection(self, temp_config_dir: Path) -> None:
         """Test updating a connection."""
         conn = Connection(name="test", hostname="old.example.com")
@@ -99,6 +158,128 @@ class TestStorage:
         assert len(connections) == 1
         assert connections[0].name == "server2"
 
+    def test_get_connections_shares_tuple_until_changed(
+        self, temp_config_dir: Path
+    ) -> None:
+        """Test that get_connections doesn't copy on every call."""
+        add_connection(Connection(name="a", hostname="a.com"))
+        connections = get_connections()
+        assert get_connections() is connections
+
+        add_connection(Connection(name="b", hostname="b.com"))
+        assert [c.name for c in get_connections()] == ["a", "b"]
+
+        update_connection(0, Connection(name="c", hostname="c.com"))
+        assert [c.name for c in get_connections()] == ["c", "b"]
+
+    def test_get_connection_by_name(self, temp_config_dir: Path) -> None:
+        """Test looking up connections by name as the list changes."""
+        add_connection(Connection(name="server1", hostname="example1.com"))
+        add_connection(Connection(name="server2", hostname="example2.com"))
+
+        assert get_connection_by_name("server2").hostname == "example2.com"
+        assert get_connection_by_name("missing") is None
+
+        delete_connection(0)
+        update_connection(0, Connection(name="renamed", hostname="example2.com"))
+        add_connection(Connection(name="server3", hostname="example3.com"))
+
+        assert get_connection_by_name("server1") is None
+        assert get_connection_by_name("server2") is None
+        assert get_connection_by_name("renamed").hostname == "example2.com"
+        assert get_connection_by_name("server3").hostname == "example3.com"
+
+    def test_get_connection_by_name_returns_first_duplicate(
+        self, temp_config_dir: Path
+    ) -> None:
+        """Test that renames and deletes keep the first name match in front."""
+        add_connection(Connection(name="a", hostname="a.com"))
+        add_connection(Connection(name="b", hostname="b1.com"))
+        assert get_connection_by_name("b").hostname == "b1.com"
+
+        update_connection(0, Connection(name="b", hostname="b0.com"))
+        assert get_connection_by_name("b").hostname == "b0.com"
+        assert get_connection_by_name("a") is None
+
+        delete_connection(0)
+        assert get_connection_by_name("b").hostname == "b1.com"
+
+        update_connection(0, Connection(name="c", hostname="c.com"))
+        assert get_connection_by_name("b") is None
+        assert get_connection_by_name("c").hostname == "c.com"
+
+    def test_save_config_skips_identical_write(self, temp_config_dir: Path) -> None:
+        """Test that saving unchanged contents leaves the file untouched."""
+        config = AppConfig(connections=[Connection(name="a", hostname="a.com")])
+        save_config(config)
+        config_path = temp_config_dir / "connections.json"
+        # An actual save replaces the file, giving it a new inode
+        inode = config_path.stat().st_ino
+
+        save_config(AppConfig(connections=[*config.connections]))
+        assert config_path.stat().st_ino == inode
+
+        save_config(AppConfig(connections=[Connection(name="b", hostname="b.com")]))
+        assert load_config().connections[0].name == "b"
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX symlinks and modes")
+    def test_save_config_keeps_symlink_and_mode(
+        self, temp_config_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test that saving writes through a symlink and keeps permissions."""
+        target = tmp_path / "dotfiles" / "connections.json"
+        target.parent.mkdir()
+        target.write_text("{}", encoding="utf-8")
+        target.chmod(0o600)
+        link = temp_config_dir / "connections.json"
+        link.symlink_to(target)
+
+        add_connection(Connection(name="a", hostname="a.com"))
+
+        assert link.is_symlink()
+        assert "a.com" in target.read_text(encoding="utf-8")
+        assert S_IMODE(target.stat().st_mode) == 0o600
+
+    def test_failed_write_removes_temp_file(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that an interrupted save leaves neither temp file nor changes."""
+        save_config(AppConfig(connections=[Connection(name="a", hostname="a.com")]))
+
+        def fail(fd: int) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr("sshman.storage.os.fsync", fail)
+        with pytest.raises(OSError):
+            save_config(AppConfig())
+
+        assert [p.name for p in temp_config_dir.iterdir()] == ["connections.json"]
+        assert [c.name for c in load_config().connections] == ["a"]
+
+    def test_concurrent_saves_use_separate_temp_files(
+        self, temp_config_dir: Path
+    ) -> None:
+        """Test that parallel saves don't trip over a shared temp file."""
+        errors: list[BaseException] = []
+
+        def save(name: str) -> None:
+            try:
+                for _ in range(20):
+                    save_config(
+                        AppConfig(connections=[Connection(name=name, hostname="h")])
+                    )
+            except BaseException as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=save, args=(n,)) for n in "abcd"]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert [p.name for p in temp_config_dir.iterdir()] == ["connections.json"]
+
     def test_load_corrupted_config(self, temp_config_dir: Path) -> None:
         """Test loading corrupted config returns default."""
         config_path = temp_config_dir / "connections.json"
@@ -107,3 +288,189 @@ class TestStorage:
         config = load_config()
 
         assert config.connections == []
+
+    def test_load_config_reuses_cache(self, temp_config_dir: Path) -> None:
+        """Test that an unchanged config file is not parsed again."""
+        save_config(AppConfig(connections=[Connection(name="a", hostname="a.com")]))
+
+        assert load_config() is load_config()
+
+    def test_load_config_detects_external_change(self, temp_config_dir: Path) -> None:
+        """Test that modifying the file on disk invalidates the cache."""
+        save_config(AppConfig(connections=[Connection(name="a", hostname="a.com")]))
+        load_config()
+
+        config_path = temp_config_dir / "connections.json"
+        config_path.write_text(
+            '{"connections": [{"name": "b", "hostname": "b.example.com"}]}',
+            encoding="utf-8",
+        )
+
+        connections = load_config().connections
+        assert len(connections) == 1
+        assert connections[0].name == "b"
+
+    def test_load_config_ignores_unknown_fields(self, temp_config_dir: Path) -> None:
+        """Test that unknown connection keys do not invalidate the config."""
+        config_path = temp_config_dir / "connections.json"
+        config_path.write_text(
+            '{"connections": [{"name": "a", "hostname": "a.com", "extra": 1}]}',
+            encoding="utf-8",
+        )
+
+        connections = load_config().connections
+
+        assert len(connections) == 1
+        assert connections[0].name == "a"
+
+    def test_load_config_coerces_string_port(self, temp_config_dir: Path) -> None:
+        """Test that a port stored as a string still loads every connection."""
+        config_path = temp_config_dir / "connections.json"
+        config_path.write_text(
+            '{"connections": [{"name": "a", "hostname": "h", "port": "2222"},'
+            ' {"name": "b", "hostname": "h2"}]}',
+            encoding="utf-8",
+        )
+
+        connections = load_config().connections
+
+        assert [c.name for c in connections] == ["a", "b"]
+        assert connections[0].port == 2222
+
+    def test_load_config_coerces_lax_bool(self, temp_config_dir: Path) -> None:
+        """Test that every JSON backend accepts the same lax values."""
+        config_path = temp_config_dir / "connections.json"
+        config_path.write_text(
+            '{"connections": [{"name": "a", "hostname": "h", "auto_add_key": "yes"}]}',
+            encoding="utf-8",
+        )
+
+        connections = load_config().connections
+
+        assert len(connections) == 1
+        assert connections[0].auto_add_key is True
+
+    def test_json_backends_write_identical_bytes(self) -> None:
+        """Test that switching JSON library never changes the saved file."""
+        config = AppConfig(
+            connections=[
+                Connection(name="ä", hostname="h", user="u", tags=["x"]),
+                Connection(name="b", hostname="h2", port=2222, auto_add_key=True),
+            ]
+        )
+
+        encoded = {dumps(config) for _, dumps, _ in _JSON_BACKENDS.values()}
+
+        assert encoded == {_JSON_BACKENDS["json"][1](config)}
+
+    def test_load_history_reuses_cache(self, temp_config_dir: Path) -> None:
+        """Test that unchanged history is not parsed again."""
+        add_history_entry(
+            HistoryEntry(
+                connection_name="test",
+                connection_target="example.com",
+                started_at=datetime(2024, 1, 1, 12, 0),
+            )
+        )
+
+        history = load_history()
+
+        assert history is load_history()
+        assert history.entries[0].connection_name == "test"
+
+
+class TestConfigWriter:
+    """Tests for the background config writer."""
+
+    def test_close_writes_latest_config(self, temp_config_dir: Path) -> None:
+        """Test that coalesced saves leave the most recent config on disk."""
+        writer = ConfigWriter()
+        config = AppConfig()
+
+        config.connections.append(Connection(name="a", hostname="a.com"))
+        writer.save(config)
+        config.connections.append(Connection(name="b", hostname="b.com"))
+        writer.save(config)
+        writer.close()
+
+        assert [c.name for c in load_config().connections] == ["a", "b"]
+
+    def test_save_snapshots_config(self, temp_config_dir: Path) -> None:
+        """Test that mutating after save does not change what gets written."""
+        writer = ConfigWriter()
+        config = AppConfig(connections=[Connection(name="a", hostname="a.com")])
+
+        writer.save(config)
+        writer.flush()
+        config.connections.clear()
+        writer.close()
+
+        assert len(load_config().connections) == 1
+
+    def test_close_returns_save_error(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that close() returns a save failure nobody was told about."""
+        writer = ConfigWriter()
+
+        def fail(config: AppConfig) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr("sshman.storage.save_config", fail)
+        writer.save(AppConfig())
+
+        assert isinstance(writer.close(), OSError)
+
+    def test_writer_survives_failing_error_handler(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that later saves still complete after the handler raises."""
+
+        def broken_handler(error: Exception) -> None:
+            raise RuntimeError("App is not running")
+
+        real_save_config = save_config
+        calls: list[AppConfig] = []
+
+        def fail_once(config: AppConfig) -> None:
+            calls.append(config)
+            if len(calls) == 1:
+                raise ValueError("bad")
+            real_save_config(config)
+
+        monkeypatch.setattr("sshman.storage.save_config", fail_once)
+        writer = ConfigWriter(on_error=broken_handler)
+        writer.save(AppConfig())
+        writer.flush()
+
+        writer.save(AppConfig(connections=[Connection(name="a", hostname="a.com")]))
+        assert writer.close() is None
+        assert [c.name for c in load_config().connections] == ["a"]
+
+    def test_flush_does_not_wait_for_error_handler(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that flush returns while a failed save is still being reported."""
+        flushed = threading.Event()
+        reported: list[Exception] = []
+
+        def handler(error: Exception) -> None:
+            # Like call_from_thread: waits until the flushing thread moves on
+            flushed.wait(timeout=5)
+            reported.append(error)
+
+        def fail(config: AppConfig) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr("sshman.storage.save_config", fail)
+        writer = ConfigWriter(on_error=handler)
+        writer.save(AppConfig())
+
+        flusher = threading.Thread(target=writer.flush)
+        flusher.start()
+        flusher.join(timeout=2)
+        assert not flusher.is_alive()
+
+        flushed.set()
+        assert isinstance(writer.close(), OSError)
+        assert len(reported) == 1